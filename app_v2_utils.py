@@ -1,8 +1,14 @@
 import json
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
+try:
+    import orjson
+except ImportError:  # optional: faster JSON encoding/decoding when installed
+    orjson = None
+
 
 PLAN_CATEGORY_LABELS = {
     "comp": "Comprehensive",
@@ -19,6 +25,33 @@ CLAIM_STATUS_LABELS = {
 
 BADGE_TEXTS_TO_REMOVE = {"recommended for your car"}
 
+MAKE_DISPLAY_NAMES = {
+    "tata": "Tata Motors",
+    "tata motors": "Tata Motors",
+    "hyundai": "Hyundai",
+    "hyundai motors": "Hyundai",
+    "honda": "Honda",
+    "honda motors": "Honda",
+    "maruti": "Maruti Suzuki",
+    "maruti suzuki": "Maruti Suzuki",
+    "toyota": "Toyota",
+    "toyota motors": "Toyota",
+}
+
+IDV_FIELD_KEYS = {
+    "current": ("current_idv", "idv", "default_idv", "idv_value", "slider_value"),
+    "recommended": ("recommended_idv",),
+    "min": ("min_idv", "idv_min"),
+    "max": ("max_idv", "idv_max"),
+    "selected": ("idv_selected",),
+}
+
+UNSAFE_FILENAME_CHARS_RE = re.compile(r"[^\w\s-]")
+
+PREMIUM_STRIP_TABLE = str.maketrans("", "", "₹,")
+PREMIUM_DIGITS_RE = re.compile(r"\d+")
+SIGNED_AMOUNT_RE = re.compile(r"[\d,\.]+")
+
 
 def init_car_file_entry() -> Dict[str, List[Dict[str, Any]]]:
     """Return default storage structure for car files across insurers."""
@@ -97,10 +130,10 @@ def extract_signed_amount(value: Any) -> float:
     elif working.startswith("+"):
         working = working[1:]
 
-    numbers = re.findall(r"[\d,\.]+", working)
-    if not numbers:
+    match = SIGNED_AMOUNT_RE.search(working)
+    if not match:
         return 0.0
-    number_str = numbers[0].replace(",", "")
+    number_str = match.group().replace(",", "")
     try:
         return sign * float(number_str)
     except ValueError:
@@ -109,20 +142,12 @@ def extract_signed_amount(value: Any) -> float:
 
 def build_idv_info(*sources: Dict[str, Any]) -> Dict[str, float]:
     """Merge IDV information from multiple sources into a normalized dict."""
-    field_map = {
-        "current": ["current_idv", "idv", "default_idv", "idv_value", "slider_value"],
-        "recommended": ["recommended_idv"],
-        "min": ["min_idv", "idv_min"],
-        "max": ["max_idv", "idv_max"],
-        "selected": ["idv_selected"],
-    }
-
     idv_info: Dict[str, float] = {}
 
     for source in sources:
         if not isinstance(source, dict):
             continue
-        for normalized_key, possible_keys in field_map.items():
+        for normalized_key, possible_keys in IDV_FIELD_KEYS.items():
             if normalized_key in idv_info:
                 continue
             for key in possible_keys:
@@ -329,10 +354,10 @@ def extract_premium_value(premium_str: str) -> float:
     """Extract numeric value from premium string like '₹5,142' or '₹4,992'"""
     if not premium_str:
         return 0.0
-    numbers = re.findall(r"[\d,]+", premium_str.replace("₹", "").replace(",", ""))
-    if numbers:
+    match = PREMIUM_DIGITS_RE.search(premium_str.translate(PREMIUM_STRIP_TABLE))
+    if match:
         try:
-            return float(numbers[0].replace(",", ""))
+            return float(match.group())
         except ValueError:
             return 0.0
     return 0.0
@@ -340,6 +365,8 @@ def extract_premium_value(premium_str: str) -> float:
 
 def load_json_data(file_path: str) -> Dict[str, Any]:
     """Load and parse JSON insurance data from a file"""
+    if orjson is not None:
+        return orjson.loads(Path(file_path).read_bytes())
     with open(file_path, "r", encoding="utf-8") as f:
         return json.load(f)
 
@@ -388,6 +415,12 @@ def get_icici_plans(
     idv_info = build_idv_info(data)
     normalized_claim_status = normalize_claim_status(claim_status)
 
+    # Index plan variants by plan type once instead of rescanning per button
+    plan_variants_by_type: Dict[str, List[List[Dict[str, Any]]]] = {}
+    for plan_group in plans_offered.get("plans") or []:
+        for group_plan_type, plan_variants in plan_group.items():
+            plan_variants_by_type.setdefault(group_plan_type, []).append(plan_variants)
+
     for premium_info in premiums_list:
         plan_type = premium_info.get("plan_type", "")
         button_text = premium_info.get("button_text", "")
@@ -431,17 +464,11 @@ def get_icici_plans(
             "claim_status": normalized_claim_status,
         }
 
-        plans_list = plans_offered.get("plans", [])
-        if plans_list:
-            for plan_group in plans_list:
-                if plan_type in plan_group:
-                    plan_variants = plan_group[plan_type]
-                    button_idx = premium_info.get("button_index", 0)
-                    if button_idx < len(plan_variants):
-                        plan_info["benefits"] = plan_variants[button_idx].get(
-                            "benefits", []
-                        )
-                        break
+        button_idx = premium_info.get("button_index", 0)
+        for plan_variants in plan_variants_by_type.get(plan_type, []):
+            if button_idx < len(plan_variants):
+                plan_info["benefits"] = plan_variants[button_idx].get("benefits", [])
+                break
 
         plans.append(plan_info)
     return plans
@@ -455,7 +482,7 @@ def get_cholams_plans(data: List[Any], claim_status: str = "") -> List[Dict[str,
     if not isinstance(data, list) or len(data) < 2:
         return plans
 
-    plans_data = data[1] if len(data) > 1 else []
+    plans_data = data[1]
 
     for plan_obj in plans_data:
         if not isinstance(plan_obj, dict):
@@ -813,20 +840,7 @@ def normalize_make_display(make: str) -> str:
         return ""
     make_lower = make.strip().lower()
 
-    make_mappings = {
-        "tata": "Tata Motors",
-        "tata motors": "Tata Motors",
-        "hyundai": "Hyundai",
-        "hyundai motors": "Hyundai",
-        "honda": "Honda",
-        "honda motors": "Honda",
-        "maruti": "Maruti Suzuki",
-        "maruti suzuki": "Maruti Suzuki",
-        "toyota": "Toyota",
-        "toyota motors": "Toyota",
-    }
-
-    for key, value in make_mappings.items():
+    for key, value in MAKE_DISPLAY_NAMES.items():
         if key in make_lower:
             return value
 
@@ -854,6 +868,15 @@ def normalize_make_model(make: str, model: str) -> Tuple[str, str]:
     return make_norm, model_norm
 
 
+@lru_cache(maxsize=None)
+def _model_prefix_pattern(model: str) -> "re.Pattern[str]":
+    """Return a cached regex matching the model name at the start of a string."""
+    # Build a flexible regex: allow spaces between every character
+    # Example: "I20" -> "I\s*2\s*0"
+    spaced_pattern = r"\s*".join(map(re.escape, model))
+    return re.compile(rf"^{spaced_pattern}[\s\-:–—]*", re.IGNORECASE)
+
+
 def split_model_variant(model_variant: str) -> Tuple[str, str]:
     if not model_variant:
         return "", ""
@@ -863,14 +886,8 @@ def split_model_variant(model_variant: str) -> Tuple[str, str]:
     # Normalized model (e.g. "I 20" -> "I20")
     model = normalize_model_display(cleaned).strip()
 
-    # Build a flexible regex: allow spaces between every character
-    # Example: "I20" -> "I\s*2\s*0"
-    spaced_pattern = r"\s*".join(map(re.escape, model))
-
     # Remove the model from the beginning OR anywhere in string
-    pattern = re.compile(rf"^{spaced_pattern}[\s\-:–—]*", re.IGNORECASE)
-
-    variant = pattern.sub("", cleaned).strip()
+    variant = _model_prefix_pattern(model).sub("", cleaned).strip()
 
     return model, variant
 
@@ -892,6 +909,11 @@ def merge_insurer_data_into_car_map(
         entry_fields (list): List of fields to store, e.g. ["file", "registration"].
         extra_fields_func (callable, optional): If set, takes the entry and returns a dict of extra fields to add.
     """
+    # Normalize each existing key once rather than once per incoming entry
+    normalized_keys = {
+        key: normalize_make_model(key[0], key[1]) for key in car_data_map
+    }
+
     for entry in insurer_data_list:
         make = entry["make"]
         model = entry["model"]
@@ -899,14 +921,9 @@ def merge_insurer_data_into_car_map(
         make_norm, model_norm = normalize_make_model(make, model)
 
         matched = False
-        for (
-            existing_make,
-            existing_model,
-            existing_variant,
-        ), files in car_data_map.items():
-            existing_make_norm, existing_model_norm = normalize_make_model(
-                existing_make, existing_model
-            )
+        for existing_key, files in car_data_map.items():
+            existing_variant = existing_key[2]
+            existing_make_norm, existing_model_norm = normalized_keys[existing_key]
             if (
                 existing_make_norm == make_norm
                 and (
@@ -929,6 +946,7 @@ def merge_insurer_data_into_car_map(
             key = (make, model, variant)
             if key not in car_data_map:
                 car_data_map[key] = init_car_file_entry()
+                normalized_keys[key] = (make_norm, model_norm)
             data_dict = {field: entry.get(field) for field in entry_fields}
             if extra_fields_func:
                 data_dict.update(extra_fields_func(entry))
@@ -1166,6 +1184,11 @@ def format_premium(premium: Any) -> str:
     return "N/A"
 
 
+def _safe_filename_part(value: str) -> str:
+    """Strip characters that are unsafe in filenames and join words with '_'."""
+    return UNSAFE_FILENAME_CHARS_RE.sub("", value).strip().replace(" ", "_")
+
+
 def save_normalized_data(
     car_key: Tuple[str, str, str],
     all_plans_by_insurer: Dict[str, List[Dict[str, Any]]],
@@ -1188,9 +1211,9 @@ def save_normalized_data(
     output_path.mkdir(parents=True, exist_ok=True)
 
     # Create a safe filename from car details
-    safe_make = re.sub(r"[^\w\s-]", "", make).strip().replace(" ", "_")
-    safe_model = re.sub(r"[^\w\s-]", "", model).strip().replace(" ", "_")
-    safe_variant = re.sub(r"[^\w\s-]", "", variant).strip().replace(" ", "_")
+    safe_make = _safe_filename_part(make)
+    safe_model = _safe_filename_part(model)
+    safe_variant = _safe_filename_part(variant)
     filename = f"{safe_make}_{safe_model}_{safe_variant}_normalized.json"
     file_path = output_path / filename
 
@@ -1211,8 +1234,13 @@ def save_normalized_data(
         },
     }
 
-    # Save to JSON file
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(normalized_data, f, indent=2, ensure_ascii=False)
+    # Serialize once and write the file in a single call
+    if orjson is not None:
+        file_path.write_bytes(orjson.dumps(normalized_data, option=orjson.OPT_INDENT_2))
+    else:
+        file_path.write_text(
+            json.dumps(normalized_data, indent=2, ensure_ascii=False),
+            encoding="utf-8",
+        )
 
     return str(file_path)
@@ -1,4 +1,5 @@
 import re
+from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 import streamlit as st
@@ -17,10 +18,77 @@ from app_v2_utils import (
     get_unique_makes_models_variants,
     load_json_data,
     scan_all_car_data,
-    save_normalized_data,
 )
 
 
+HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+PRICING_ROWS = (
+    ("Base Premium", "base_premium"),
+    ("Own Damage Premium", "own_damage_premium"),
+    ("Third Party Premium", "third_party_premium"),
+    ("Add-ons", "addons_total"),
+    ("Discounts", "discounts_total"),
+    ("GST Amount", "gst_amount"),
+    ("Net Premium", "net_premium"),
+    ("Total Premium", "total_premium"),
+)
+
+
+INSURER_DISPLAY_NAMES = {
+    "acko": "Acko",
+    "icici": "ICICI",
+    "cholams": "Cholams",
+    "royal_sundaram": "Royal Sundaram",
+    "godigit": "Go Digit",
+}
+
+INSURER_PLAN_LOADERS = {
+    "acko": get_acko_plans,
+    "icici": get_icici_plans,
+    "cholams": get_cholams_plans,
+    "royal_sundaram": get_royal_sundaram_plans,
+    "godigit": get_godigit_plans,
+}
+
+
+def file_stamp(file_path: str) -> Tuple[int, int]:
+    """Return (mtime_ns, size) so cached loads miss when a file is rewritten."""
+    stat = Path(file_path).stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def extracted_data_fingerprint() -> Tuple[Tuple[str, int, int], ...]:
+    """Return (path, mtime_ns, size) for every extracted file, for cache keys."""
+    return tuple(
+        (str(path), *file_stamp(str(path)))
+        for path in sorted(Path("extracted").glob("*/*.json"))
+    )
+
+
+@st.cache_data(show_spinner="Loading car data...")
+def load_car_data_map(
+    fingerprint: Tuple[Tuple[str, int, int], ...],
+) -> Dict[Tuple[str, str, str], Dict[str, Any]]:
+    """Scan the extracted directory, rescanning only when ``fingerprint`` changes."""
+    return scan_all_car_data()
+
+
+@st.cache_data(show_spinner=False)
+def load_insurer_plans(
+    insurer_key: str,
+    file_path: str,
+    claim_status: str,
+    file_version: Tuple[int, int],
+) -> List[Dict[str, Any]]:
+    """Load and normalize plans from one extracted file.
+
+    ``file_version`` only feeds the cache key: pass ``file_stamp(file_path)`` so
+    a re-scraped file is read again instead of being served stale from the cache.
+    """
+    return INSURER_PLAN_LOADERS[insurer_key](load_json_data(file_path), claim_status)
+
+
 def format_signed_currency(value: Optional[float]) -> str:
     """Format currency values while preserving the sign for discounts."""
     if value is None:
@@ -36,18 +104,7 @@ def build_pricing_rows(pricing_breakdown: Dict[str, Any]) -> List[Dict[str, str]
 
     rows = []
 
-    row_map = [
-        ("Base Premium", "base_premium"),
-        ("Own Damage Premium", "own_damage_premium"),
-        ("Third Party Premium", "third_party_premium"),
-        ("Add-ons", "addons_total"),
-        ("Discounts", "discounts_total"),
-        ("GST Amount", "gst_amount"),
-        ("Net Premium", "net_premium"),
-        ("Total Premium", "total_premium"),
-    ]
-
-    for label, key in row_map:
+    for label, key in PRICING_ROWS:
         value = pricing_breakdown.get(key)
         if value is None:
             continue
@@ -169,7 +226,7 @@ def display_plan_card(
         # Description
         description = plan.get("description", "")
         if description:
-            clean_desc = re.sub(r"<[^>]+>", "", description)
+            clean_desc = HTML_TAG_RE.sub("", description)
             if len(clean_desc) > 120:
                 clean_desc = clean_desc[:120] + "..."
             st.markdown(f"*{clean_desc}*")
@@ -183,24 +240,26 @@ def display_plan_card(
         benefits = plan.get("benefits", [])
         addons = plan.get("addons", [])
 
+        # Render each list as a single markdown element (one line per item)
         if benefits:
             with st.expander("Benefits", expanded=False):
-                for benefit in benefits:
-                    st.markdown(f"• {benefit}")
+                st.markdown("  \n".join(f"• {benefit}" for benefit in benefits))
 
         if addons:
             with st.expander("Add-ons & Covers", expanded=False):
+                addon_lines = []
                 for addon in addons:
                     if isinstance(addon, dict):
                         name = addon.get("name", addon.get("display_name", "Unknown"))
                         price = addon.get("price", addon.get("net_premium", 0))
                         if price:
                             price_str = format_premium(price)
-                            st.markdown(f"• **{name}**: {price_str}")
+                            addon_lines.append(f"• **{name}**: {price_str}")
                         else:
-                            st.markdown(f"• **{name}**")
+                            addon_lines.append(f"• **{name}**")
                     else:
-                        st.markdown(f"• {addon}")
+                        addon_lines.append(f"• {addon}")
+                st.markdown("  \n".join(addon_lines))
 
 
 def _format_addons_csv(addons: Any) -> str:
@@ -265,8 +324,7 @@ def homepage():
 
     # JSON view for car data map (for debugging or exploration)
     if "car_data_map" not in st.session_state:
-        with st.spinner("Loading car data..."):
-            st.session_state.car_data_map = scan_all_car_data()
+        st.session_state.car_data_map = load_car_data_map(extracted_data_fingerprint())
 
     # JSON/dict preview: show as list of strings of the key triple, to avoid serialization error
     # car_data_map_preview = [
@@ -326,13 +384,7 @@ def homepage():
         key = (selected_make, selected_model, selected_variant)
         car_files = car_data_map.get(key, {})
 
-        if (
-            not car_files.get("acko")
-            and not car_files.get("icici")
-            and not car_files.get("cholams")
-            and not car_files.get("royal_sundaram")
-            and not car_files.get("godigit")
-        ):
+        if not any(car_files.values()):
             st.warning(
                 f"No insurance data found for {selected_make} {selected_model} {selected_variant}"
             )
@@ -343,98 +395,26 @@ def homepage():
             f"Available Plans for {selected_make} {selected_model} {selected_variant}"
         )
 
-        # Load and display plans grouped by insurer
+        # Load and display plans grouped by insurer (all available claim statuses)
         all_plans_by_insurer = {}
-
-        # Load Acko plans (all available claim statuses)
-        acko_plans: List[Dict[str, Any]] = []
-        if car_files.get("acko"):
-            for acko_file_info in car_files["acko"]:
-                try:
-                    acko_data = load_json_data(acko_file_info["file"])
-                    acko_plans.extend(
-                        get_acko_plans(
-                            acko_data, acko_file_info.get("claim_status", "")
-                        )
-                    )
-                except Exception as e:
-                    st.error(
-                        f"Error loading Acko data from {acko_file_info['file']}: {e}"
-                    )
-            if acko_plans:
-                all_plans_by_insurer["Acko"] = acko_plans
-
-        # Load ICICI plans (all available claim statuses)
-        icici_plans: List[Dict[str, Any]] = []
-        if car_files.get("icici"):
-            for icici_file_info in car_files["icici"]:
-                try:
-                    icici_data = load_json_data(icici_file_info["file"])
-                    icici_plans.extend(
-                        get_icici_plans(
-                            icici_data, icici_file_info.get("claim_status", "")
-                        )
-                    )
-                except Exception as e:
-                    st.error(
-                        f"Error loading ICICI data from {icici_file_info['file']}: {e}"
-                    )
-            if icici_plans:
-                all_plans_by_insurer["ICICI"] = icici_plans
-
-        # Load Cholams plans (all available claim statuses)
-        cholams_plans: List[Dict[str, Any]] = []
-        if car_files.get("cholams"):
-            for cholams_file_info in car_files["cholams"]:
-                try:
-                    cholams_data = load_json_data(cholams_file_info["file"])
-                    cholams_plans.extend(
-                        get_cholams_plans(
-                            cholams_data, cholams_file_info.get("claim_status", "")
-                        )
-                    )
-                except Exception as e:
-                    st.error(
-                        f"Error loading Cholams data from {cholams_file_info['file']}: {e}"
-                    )
-            if cholams_plans:
-                all_plans_by_insurer["Cholams"] = cholams_plans
-
-        # Load Royal Sundaram plans (all available claim statuses)
-        royal_sundaram_plans: List[Dict[str, Any]] = []
-        if car_files.get("royal_sundaram"):
-            for royal_file_info in car_files["royal_sundaram"]:
-                try:
-                    royal_data = load_json_data(royal_file_info["file"])
-                    royal_sundaram_plans.extend(
-                        get_royal_sundaram_plans(
-                            royal_data, royal_file_info.get("claim_status", "")
-                        )
-                    )
-                except Exception as e:
-                    st.error(
-                        f"Error loading Royal Sundaram data from {royal_file_info['file']}: {e}"
-                    )
-            if royal_sundaram_plans:
-                all_plans_by_insurer["Royal Sundaram"] = royal_sundaram_plans
-
-        # Load Go Digit plans (all available claim statuses)
-        godigit_plans: List[Dict[str, Any]] = []
-        if car_files.get("godigit"):
-            for godigit_file_info in car_files["godigit"]:
+        for insurer_key, insurer_name in INSURER_DISPLAY_NAMES.items():
+            insurer_plans: List[Dict[str, Any]] = []
+            for file_info in car_files.get(insurer_key, []):
                 try:
-                    godigit_data = load_json_data(godigit_file_info["file"])
-                    godigit_plans.extend(
-                        get_godigit_plans(
-                            godigit_data, godigit_file_info.get("claim_status", "")
+                    insurer_plans.extend(
+                        load_insurer_plans(
+                            insurer_key,
+                            file_info["file"],
+                            file_info.get("claim_status", ""),
+                            file_stamp(file_info["file"]),
                         )
                     )
                 except Exception as e:
                     st.error(
-                        f"Error loading Go Digit data from {godigit_file_info['file']}: {e}"
+                        f"Error loading {insurer_name} data from {file_info['file']}: {e}"
                     )
-            if godigit_plans:
-                all_plans_by_insurer["Go Digit"] = godigit_plans
+            if insurer_plans:
+                all_plans_by_insurer[insurer_name] = insurer_plans
 
         # Build and display summary statistics
         summary_stats = build_summary_stats(all_plans_by_insurer)
@@ -444,15 +424,15 @@ def homepage():
 
         # Display plans in tabs grouped by insurer
         if all_plans_by_insurer:
+            sorted_insurers = sorted(all_plans_by_insurer)
             tab_names = [
-                f"{insurer} ({len(plans)} plans)"
-                for insurer, plans in sorted(all_plans_by_insurer.items())
+                f"{insurer} ({len(all_plans_by_insurer[insurer])} plans)"
+                for insurer in sorted_insurers
             ]
             tabs = st.tabs(tab_names)
 
-            sorted_insurers = sorted(all_plans_by_insurer.keys())
-            for idx, insurer_name in enumerate(sorted_insurers):
-                with tabs[idx]:
+            for tab, insurer_name in zip(tabs, sorted_insurers):
+                with tab:
                     plans = all_plans_by_insurer[insurer_name]
                     if plans:
                         for plan in plans:
@@ -620,20 +600,16 @@ def apply_sidebar_filters(
     available_categories = sorted(
         set(plan.get("category", "") for plan in all_plans if plan.get("category"))
     )
-    category_options = ["All Plan Types"] + [
-        get_plan_category_label(cat) for cat in available_categories
-    ]
+    # Map each display label back to its category key (first key wins)
+    category_by_label: Dict[str, str] = {}
+    for cat in available_categories:
+        category_by_label.setdefault(get_plan_category_label(cat), cat)
+    category_options = ["All Plan Types"] + list(category_by_label)
     selected_category_label = st.sidebar.selectbox(
         "Plan Type", options=category_options, index=0
     )
 
-    selected_category = ""
-    if selected_category_label != "All Plan Types":
-        # Find the category key for the selected label
-        for cat in available_categories:
-            if get_plan_category_label(cat) == selected_category_label:
-                selected_category = cat
-                break
+    selected_category = category_by_label.get(selected_category_label, "")
 
     # Filter plans by type
     filtered_plans = all_plans
@@ -1,10 +1,13 @@
-from typing import Any, Dict, List
-
 import streamlit as st
 import pandas as pd
 
-from app_v2_utils import format_claim_status, format_premium, save_normalized_data
-from overview import apply_sidebar_filters, display_plan_card, plans_to_dataframe
+from app_v2_utils import format_claim_status, format_premium
+from overview import (
+    apply_sidebar_filters,
+    display_plan_card,
+    plans_to_dataframe,
+    _collect_all_plans_for_current_car,
+)
 
 
 def comparison_page():
@@ -23,18 +26,11 @@ def comparison_page():
         return
 
     selected_car_key = st.session_state.selected_car_key
-    all_plans_by_insurer = st.session_state.all_plans_by_insurer
 
     make, model, variant = selected_car_key
     st.markdown(f"**Comparing plans for:** {make} {model} {variant}")
 
-    # Collect all plans
-    all_plans = []
-    for insurer, plans in all_plans_by_insurer.items():
-        for plan in plans:
-            plan_copy = plan.copy()
-            plan_copy["insurer"] = insurer
-            all_plans.append(plan_copy)
+    all_plans = _collect_all_plans_for_current_car()
 
     if not all_plans:
         st.warning("No plans available for comparison.")
@@ -44,13 +40,15 @@ def comparison_page():
     filtered_plans, filter_meta = apply_sidebar_filters(all_plans)
     price_range = filter_meta.get("price_range")
 
-    # Reorganize filtered plans by insurer for saving
+    # Reorganize filtered plans by insurer (for saving and summary cards) and
+    # by plan type (for the detailed comparison) in a single pass
     filtered_plans_by_insurer = {}
+    plans_by_category = {}
     for plan in filtered_plans:
         insurer = plan.get("insurer", "Unknown")
-        if insurer not in filtered_plans_by_insurer:
-            filtered_plans_by_insurer[insurer] = []
-        filtered_plans_by_insurer[insurer].append(plan)
+        filtered_plans_by_insurer.setdefault(insurer, []).append(plan)
+        category = plan.get("category_display") or plan.get("category", "Other")
+        plans_by_category.setdefault(category, []).append(plan)
 
     # # Save button for filtered data
     # if st.button("💾 Save Filtered Data", use_container_width=False):
@@ -95,32 +93,24 @@ def comparison_page():
         summary_cols[1].metric("Lowest Premium", format_premium(min(premiums)))
         summary_cols[2].metric("Highest Premium", format_premium(max(premiums)))
 
-    insurer_counts = {}
-    for plan in filtered_plans:
-        insurer_counts.setdefault(plan.get("insurer", "Unknown"), []).append(plan)
-
-    st.markdown(
-        "<div style='display:flex;gap:1rem;flex-wrap:wrap;'>"
-        + "".join(
+    insurer_cards = []
+    for insurer, plans in filtered_plans_by_insurer.items():
+        premiums = [p.get("premium_value", 0) for p in plans]
+        insurer_cards.append(
             f"<div style='flex:1 1 220px;border:1px solid #e2e8f0;border-radius:0.75rem;padding:0.75rem;background:#f8fafc;'>"
             f"<div style='font-size:0.85rem;color:#475569;text-transform:uppercase;letter-spacing:0.08em;'>{insurer}</div>"
             f"<div style='font-size:1.4rem;font-weight:700;color:#0f172a;margin:0.2rem 0;'>{len(plans)} plans</div>"
-            f"<div style='font-size:0.8rem;color:#64748b;'>₹{int(min(p.get('premium_value', 0) for p in plans)):,} – ₹{int(max(p.get('premium_value', 0) for p in plans)):,}</div>"
+            f"<div style='font-size:0.8rem;color:#64748b;'>₹{int(min(premiums)):,} – ₹{int(max(premiums)):,}</div>"
             "</div>"
-            for insurer, plans in insurer_counts.items()
         )
+
+    st.markdown(
+        "<div style='display:flex;gap:1rem;flex-wrap:wrap;'>"
+        + "".join(insurer_cards)
         + "</div>",
         unsafe_allow_html=True,
     )
 
-    # Group by plan type for better comparison
-    plans_by_category = {}
-    for plan in filtered_plans:
-        category = plan.get("category_display") or plan.get("category", "Other")
-        if category not in plans_by_category:
-            plans_by_category[category] = []
-        plans_by_category[category].append(plan)
-
     # Display comparison table
     st.subheader("Premium Comparison Table")
     comparison_data = []
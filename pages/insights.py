@@ -1,3 +1,4 @@
+import re
 from typing import Any, Dict, List
 
 import streamlit as st
@@ -8,6 +9,11 @@ from app_v2_utils import format_premium, normalize_claim_status
 from overview import apply_sidebar_filters, _collect_all_plans_for_current_car
 
 
+# Simple heuristic: add-on names that indicate strong protection covers
+PROTECTION_KEYWORDS = ["zero dep", "zero depreciation", "engine", "ncb", "rsa"]
+PROTECTION_KEYWORDS_RE = re.compile("|".join(map(re.escape, PROTECTION_KEYWORDS)))
+
+
 def insights_page():
     """Insights page showing higher-level analytics for the filtered plans."""
     st.title("Plan Insights")
@@ -49,7 +55,10 @@ def insights_page():
         (max_premium - min_premium) / max_premium * 100 if max_premium else 0
     )
 
-    unique_insurers = sorted(set(p.get("insurer", "") for p in filtered_plans))
+    plans_by_insurer: Dict[str, List[Dict[str, Any]]] = {}
+    for p in filtered_plans:
+        plans_by_insurer.setdefault(p.get("insurer", ""), []).append(p)
+    unique_insurers = sorted(plans_by_insurer)
 
     def _addons_count(plan: Dict[str, Any]) -> int:
         addons = plan.get("addons") or []
@@ -61,21 +70,16 @@ def insights_page():
     avg_addons = sum(addons_counts) / len(addons_counts) if addons_counts else 0
 
     # Simple heuristic: how often do strong protection add‑ons appear?
-    protection_keywords = ["zero dep", "zero depreciation", "engine", "ncb", "rsa"]
-
     def _has_protection_addon(plan: Dict[str, Any]) -> bool:
         addons = plan.get("addons") or []
-        addon_names: List[str] = []
         for addon in addons:
             if isinstance(addon, dict):
                 name = addon.get("name") or addon.get("display_name") or ""
-                addon_names.append(str(name).lower())
             else:
-                addon_names.append(str(addon).lower())
-        return any(
-            any(keyword in name for keyword in protection_keywords)
-            for name in addon_names
-        )
+                name = addon
+            if PROTECTION_KEYWORDS_RE.search(str(name).lower()):
+                return True
+        return False
 
     protection_plans = [p for p in filtered_plans if _has_protection_addon(p)]
     protection_share = (
@@ -104,7 +108,7 @@ def insights_page():
     # Bar: average premium by insurer
     insurer_stats = []
     for insurer in unique_insurers:
-        insurer_plans = [p for p in filtered_plans if p.get("insurer") == insurer]
+        insurer_plans = plans_by_insurer[insurer]
         if not insurer_plans:
             continue
         ips = [p.get("premium_value", 0) for p in insurer_plans]
@@ -175,7 +179,7 @@ def insights_page():
 
     table_rows = []
     for insurer in unique_insurers:
-        insurer_plans = [p for p in filtered_plans if p.get("insurer") == insurer]
+        insurer_plans = plans_by_insurer[insurer]
         if not insurer_plans:
             continue
 